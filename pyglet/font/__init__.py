@@ -109,7 +109,9 @@ def load(name=None, size=None, bold=False, italic=False, dpi=None):
         `size` : float
             Size of the font, in points.  The returned font may be an exact
             match or the closest available.  In pyglet 1.1, the size may be
-            omitted, and defaults to 12pt.
+            omitted, and defaults to 12pt.  The size is rounded to one
+            decimal place, so that nearly identical sizes (for example, from
+            an animated scale) share a single font and glyph textures.
         `bold` : bool
             If True, a bold variant is returned, if one exists for the given
             family and size.
@@ -125,6 +127,8 @@ def load(name=None, size=None, bold=False, italic=False, dpi=None):
     # Arbitrary default size
     if size is None:
         size = 12
+    else:
+        size = round(size, 1)
 
     if dpi is None:
         dpi = 96
@@ -208,8 +212,10 @@ def add_directory(dir):
 
     """
     for file in os.listdir(dir):
-        if file[-4:].lower() == '.ttf':
-            add_file(os.path.join(dir, file))
+        if file.lower().endswith('.ttf'):
+            path = os.path.join(dir, file)
+            if os.path.isfile(path):
+                add_file(path)
 
 
 from .text import Text
@@ -69,10 +69,146 @@ by this package.
 from __future__ import division
 from builtins import object
 
+import array
+import re
+import struct
 import warnings
+from bisect import bisect_left, bisect_right
+from ctypes import *
 
 import pyglet
 from pyglet.gl import *
+from pyglet.graphics import vertexbuffer
+
+# Characters that end a line, and characters that a line may be broken after.
+_newline_re = re.compile(u'\n')
+_space_re = re.compile(u'[\u0020\u200b]')
+
+def _find_break_indices(text, glyph_count):
+    '''Find the characters of `text` that a line may be broken after.
+
+    Only the first `glyph_count` characters, which have a matching glyph,
+    can be measured, so later characters are ignored.
+
+    :rtype: (list of int, list of int)
+    :return: the indices of newlines, and the indices of spaces.
+    '''
+    measured = text[:glyph_count]
+    return ([m.start() for m in _newline_re.finditer(measured)],
+            [m.start() for m in _space_re.finditer(measured)])
+
+# Size in bytes of one vertex in a glyph string's vertex array.
+_vertex_stride = 4 * sizeof(c_float)
+
+class _QuadIndexBuffer(object):
+    '''Element buffer drawing glyph quads as pairs of triangles.
+
+    A single buffer is shared by all glyph strings in an OpenGL object space,
+    and grows to cover the longest string seen so far.
+    '''
+    #: Number of quads covered by the initial buffer.
+    initial_capacity = 1024
+
+    def __init__(self):
+        self.capacity = 0
+        self.buffer = None
+
+    def ensure(self, count):
+        '''Grow the buffer, if necessary, to cover at least `count` quads.'''
+        if count <= self.capacity:
+            return
+        capacity = max(count, self.capacity * 2, self.initial_capacity)
+        indices = []
+        for i in range(0, capacity * 4, 4):
+            indices += (i, i + 1, i + 2, i, i + 2, i + 3)
+        # array.array converts the list in C, unlike the GLuint array
+        # constructor; its address is passed straight to the buffer.
+        data = array.array('I', indices)
+        data_ptr, data_length = data.buffer_info()
+
+        if self.buffer is not None:
+            self.buffer.delete()
+        self.buffer = vertexbuffer.create_buffer(
+            data_length * data.itemsize,
+            GL_ELEMENT_ARRAY_BUFFER, GL_STATIC_DRAW)
+        self.buffer.set_data(data_ptr)
+        self.capacity = capacity
+
+def _get_quad_index_buffer(count):
+    '''Get the current object space's quad index buffer, grown to cover at
+    least `count` quads.'''
+    object_space = pyglet.gl.current_context.object_space
+    try:
+        index_buffer = object_space.pyglet_font_quad_index_buffer
+    except AttributeError:
+        index_buffer = object_space.pyglet_font_quad_index_buffer = \
+            _QuadIndexBuffer()
+    index_buffer.ensure(count)
+    return index_buffer
+
+# Free client-side arrays for building vertex data, keyed by capacity (a
+# power of two number of floats).  The data is copied into the glyph string's
+# buffer on construction, so arrays are returned to the pool straight away
+# instead of being reallocated for every string.  Only arrays of up to
+# `_vertex_array_pool_limit` floats (1024 glyphs) are kept, so the array for
+# a very long one-off string is freed rather than held for good.
+_vertex_array_pool = {}
+_vertex_array_pool_limit = 1024 * 16
+
+def _get_vertex_array(size):
+    '''Get a float array from the pool with room for at least `size` floats.'''
+    capacity = 1 << max(size - 1, 0).bit_length()
+    try:
+        return _vertex_array_pool[capacity].pop()
+    except (KeyError, IndexError):
+        return (c_float * capacity)()
+
+def _release_vertex_array(vertices):
+    '''Return an array obtained with `_get_vertex_array` to the pool.'''
+    if len(vertices) > _vertex_array_pool_limit:
+        return
+    _vertex_array_pool.setdefault(len(vertices), []).append(vertices)
+
+# One glyph quad: four vertices of (u, v, x, y).
+_quad_struct = struct.Struct('=16f')
+
+def _build_quad_array(glyphs, x, y, vertices, slots=None):
+    '''Write a run of glyph quads into an interleaved vertex array.
+
+    Each vertex is 2 floats of texture coordinate followed by 2 floats of
+    position (the r texture coordinate and z position are always 0 for
+    glyphs, so are dropped).  Each quad is packed straight into `vertices`,
+    which must hold at least 16 floats per glyph.
+
+    Glyphs are laid out left to right in the order given.  If `slots` is
+    given, it holds the index of the quad to write for each glyph; otherwise
+    quads are written in the same order as the glyphs.
+
+    :rtype: list of float
+    :return: the x coordinate following each glyph.
+    '''
+    pack_into = _quad_struct.pack_into
+    stride = _quad_struct.size
+    if slots is None:
+        offsets = range(0, len(glyphs) * stride, stride)
+    else:
+        offsets = [slot * stride for slot in slots]
+    cumulative_advance = []
+    for glyph, offset in zip(glyphs, offsets):
+        t = glyph.tex_coords
+        v0, v1, v2, v3 = glyph.vertices
+        left = x + v0
+        right = x + v2
+        bottom = y + v1
+        top = y + v3
+        pack_into(vertices, offset,
+                  t[0], t[1], left, bottom,
+                  t[3], t[4], right, bottom,
+                  t[6], t[7], right, top,
+                  t[9], t[10], left, top)
+        x += glyph.advance
+        cumulative_advance.append(x)
+    return cumulative_advance
 
 class GlyphString(object):
     '''An immutable string of glyphs that can be rendered quickly.
@@ -107,40 +243,77 @@ class GlyphString(object):
         '''
         warnings.warn('Use `pyglet.text.layout` classes instead', DeprecationWarning)
 
-        # Create an interleaved array in GL_T2F_V3F format and determine
-        # state changes required.
+        # Create an interleaved vertex array and determine state changes
+        # required.  Quads are grouped by texture, so that each texture is
+        # bound once however the glyphs are interleaved in the text.  Each
+        # state is (first quad, quad count, texture), with the text indices
+        # of its glyphs kept in the matching entry of _state_indices.
 
-        lst = []
-        texture = None
         self.text = text
-        self.states = []
-        self.cumulative_advance = [] # for fast post-string breaking
-        state_from = 0
-        state_length = 0
-        for i, glyph in enumerate(glyphs):
-            if glyph.owner != texture:
-                if state_length:
-                    self.states.append((state_from, state_length, texture))
-                texture = glyph.owner
-                state_from = i
-                state_length = 0
-            state_length += 1
-            t = glyph.tex_coords
-            lst += [t[0], t[1], t[2], 1.,
-                    x + glyph.vertices[0], y + glyph.vertices[1], 0., 1.,
-                    t[3], t[4], t[5], 1.,
-                    x + glyph.vertices[2], y + glyph.vertices[1], 0., 1.,
-                    t[6], t[7], t[8], 1.,
-                    x + glyph.vertices[2], y + glyph.vertices[3], 0., 1.,
-                    t[9], t[10], t[11], 1.,
-                    x + glyph.vertices[0], y + glyph.vertices[3], 0., 1.]
-            x += glyph.advance
-            self.cumulative_advance.append(x)
-        self.states.append((state_from, state_length, texture))
-
-        self.array = (c_float * len(lst))(*lst)
+        single = len(glyphs) == 1
+        slots = None
+        if not glyphs:
+            self.states = []
+            self._state_indices = []
+        elif single or len(set(g.owner for g in glyphs)) == 1:
+            # Common case: the whole string is on a single font texture.
+            self.states = [(0, len(glyphs), glyphs[0].owner)]
+            self._state_indices = [range(len(glyphs))]
+        else:
+            textures = []
+            indices_by_texture = {}
+            for i, glyph in enumerate(glyphs):
+                try:
+                    indices_by_texture[glyph.owner].append(i)
+                except KeyError:
+                    indices_by_texture[glyph.owner] = [i]
+                    textures.append(glyph.owner)
+
+            self.states = []
+            self._state_indices = []
+            slots = [0] * len(glyphs)
+            slot = 0
+            for texture in textures:
+                indices = indices_by_texture[texture]
+                self.states.append((slot, len(indices), texture))
+                self._state_indices.append(indices)
+                for i in indices:
+                    slots[i] = slot
+                    slot += 1
+
+        # Draw calls for the whole string, as (texture id, first index,
+        # index count), so that the common case of drawing everything does
+        # not need to clip each state.
+        self._draw_states = []
+        for (state_from, state_length, texture), indices in \
+                zip(self.states, self._state_indices):
+            state_length = bisect_left(indices, len(text))
+            if state_length:
+                self._draw_states.append(
+                    (texture.id, state_from * 6, state_length * 6))
+
+        vertices = _get_vertex_array(len(glyphs) * 16)
+        self.cumulative_advance = _build_quad_array(  # for fast post-string breaking
+            glyphs, x, y, vertices, slots)
+        if self.cumulative_advance:
+            x = self.cumulative_advance[-1]
         self.width = x
 
+        # The vertices never change, so keep them on the server.  A single
+        # glyph (a caret, or one digit of a counter) is too small to be worth
+        # the buffer object round trips, so is kept in client memory.
+        self._vertex_buffer = vertexbuffer.create_buffer(
+            len(glyphs) * _vertex_stride * 4, usage=GL_STATIC_DRAW,
+            vbo=not single)
+        self._vertex_buffer.set_data(vertices)
+        _release_vertex_array(vertices)
+        _get_quad_index_buffer(len(glyphs))
+
+        # Indices of characters that may be broken after, for
+        # `get_break_index`.
+        self._newline_indices, self._space_indices = \
+            _find_break_indices(text, len(glyphs))
+
     def get_break_index(self, from_index, width):
         '''Find a breakpoint within the text for a given width.
 
@@ -162,21 +335,28 @@ class GlyphString(object):
         :return: the index of text which will be used as the breakpoint, or
             `from_index` if there is no valid breakpoint.
         '''
-        to_index = from_index
-        if from_index >= len(self.text):
+        n = min(len(self.text), len(self.cumulative_advance))
+        if from_index >= n:
             return from_index
         if from_index:
             width += self.cumulative_advance[from_index-1]
-        for i, (c, w) in enumerate(
-                zip(self.text[from_index:],
-                    self.cumulative_advance[from_index:])):
-            if c in u'\u0020\u200b':
-                to_index = i + from_index + 1
-            if c == '\n':
-                return i + from_index + 1
-            if w > width:
-                return to_index
-        return to_index
+
+        # Consider characters up to and including the first one whose
+        # cumulative advance overflows `width`; that character may itself
+        # be a breakpoint.
+        last = min(bisect_right(self.cumulative_advance, width, from_index, n),
+                   n - 1)
+
+        newlines = self._newline_indices
+        i = bisect_left(newlines, from_index)
+        if i < len(newlines) and newlines[i] <= last:
+            return newlines[i] + 1
+
+        spaces = self._space_indices
+        i = bisect_right(spaces, last) - 1
+        if i >= 0 and spaces[i] >= from_index:
+            return spaces[i] + 1
+        return from_index
 
     def get_subwidth(self, from_index, to_index):
         '''Return the width of a slice of this string.
@@ -213,7 +393,7 @@ class GlyphString(object):
         '''
         if from_index >= len(self.text) or \
            from_index == to_index or \
-           not self.text:
+           not self.states:
             return
 
         # XXX Safe to assume all required textures will use same blend state I
@@ -227,16 +407,45 @@ class GlyphString(object):
             to_index = len(self.text)
 
         glPushClientAttrib(GL_CLIENT_VERTEX_ARRAY_BIT)
-        glInterleavedArrays(GL_T4F_V4F, 0, self.array)
-        for state_from, state_length, texture in self.states:
-            if state_from + state_length < from_index:
-                continue
-            state_from = max(state_from, from_index)
-            state_length = min(state_length, to_index - state_from)
-            if state_length <= 0:
-                break
-            glBindTexture(GL_TEXTURE_2D, texture.id)
-            glDrawArrays(GL_QUADS, state_from * 4, state_length * 4)
+        # Only the texture coordinate and vertex arrays may be read, as with
+        # glInterleavedArrays, which disabled all the others.
+        glDisableClientState(GL_COLOR_ARRAY)
+        glDisableClientState(GL_NORMAL_ARRAY)
+        glDisableClientState(GL_INDEX_ARRAY)
+        glDisableClientState(GL_EDGE_FLAG_ARRAY)
+        if gl_info.have_version(1, 4):
+            glDisableClientState(GL_SECONDARY_COLOR_ARRAY)
+            glDisableClientState(GL_FOG_COORD_ARRAY)
+        glEnableClientState(GL_TEXTURE_COORD_ARRAY)
+        glEnableClientState(GL_VERTEX_ARRAY)
+        self._vertex_buffer.bind()
+        vertices = self._vertex_buffer.ptr
+        glTexCoordPointer(2, GL_FLOAT, _vertex_stride, vertices)
+        glVertexPointer(2, GL_FLOAT, _vertex_stride,
+                        vertices + 2 * sizeof(c_float))
+        index_buffer = _get_quad_index_buffer(
+            len(self.cumulative_advance)).buffer
+        index_buffer.bind()
+        indices = index_buffer.ptr
+        index_size = sizeof(GLuint)
+        if from_index == 0 and to_index == len(self.text):
+            for texture_id, first, count in self._draw_states:
+                glBindTexture(GL_TEXTURE_2D, texture_id)
+                glDrawElements(GL_TRIANGLES, count, GL_UNSIGNED_INT,
+                               indices + first * index_size)
+        else:
+            for (state_from, state_length, texture), glyph_indices in \
+                    zip(self.states, self._state_indices):
+                # The state's glyphs are in text order, so those within
+                # [from_index, to_index) are a contiguous run of its quads.
+                start = bisect_left(glyph_indices, from_index)
+                end = bisect_left(glyph_indices, to_index)
+                if start >= end:
+                    continue
+                glBindTexture(GL_TEXTURE_2D, texture.id)
+                glDrawElements(GL_TRIANGLES, (end - start) * 6,
+                               GL_UNSIGNED_INT,
+                               indices + (state_from + start) * 6 * index_size)
         glPopClientAttrib()
 
         if from_index:
@@ -57,8 +57,50 @@ import time
 
 from pyglet import clock
 from pyglet import event
+from pyglet import gl
 from pyglet.window import key
 
+try:
+    _monotonic = time.monotonic
+except AttributeError:
+    # Python 2
+    _monotonic = time.time
+
+try:
+    # Constant time for str, which records whether it is pure ASCII.
+    _is_ascii = str.isascii
+except AttributeError:
+    # Python < 3.7
+    def _is_ascii(text):
+        return False
+
+_word_start_re = re.compile(r'\b\w', re.UNICODE)
+# Same matches on ASCII text, without consulting the Unicode tables.
+_ascii_word_start_re = re.compile(r'\b\w', getattr(re, 'ASCII', 0))
+
+def _get_next_word_start(text, pos):
+    # A word starts at a word character preceded by a non-word
+    # character; the start of the text itself is never a next word.
+    if _is_ascii(text):
+        word_start_re = _ascii_word_start_re
+    else:
+        word_start_re = _word_start_re
+    m = word_start_re.search(text, max(pos, 1))
+    if not m:
+        return len(text)
+    return m.start()
+
+def _get_previous_word_start(text, pos):
+    # Start of the last word before `pos`, or 0 if there is none.  Walks
+    # backwards so the cost depends on the distance moved, not on `pos`.
+    # Word characters are the same as for \w.
+    i = min(pos, len(text))
+    while i > 0 and not (text[i - 1].isalnum() or text[i - 1] == '_'):
+        i -= 1
+    while i > 0 and (text[i - 1].isalnum() or text[i - 1] == '_'):
+        i -= 1
+    return i
+
 class Caret(object):
     '''Visible text insertion marker for 
     `pyglet.text.layout.IncrementalTextLayout`.
@@ -83,19 +125,6 @@ class Caret(object):
     appropriate widget.  pyglet does not provide such a toolkit at this stage.
     '''
 
-    _next_word_re = re.compile(r'(?<=\W)\w')
-    _previous_word_re = re.compile(r'(?<=\W)\w+\W*$')
-    _next_para_re = re.compile(r'\n', flags=re.DOTALL)
-    _previous_para_re = re.compile(r'\n', flags=re.DOTALL)
-
-    _position = 0
-
-    _active = True
-    _visible = True
-    _blink_visible = True
-    _click_count = 0
-    _click_time = 0
-
     #: Blink period, in seconds.
     PERIOD = 0.5
 
@@ -118,19 +147,27 @@ class Caret(object):
                 RGB tuple with components in range [0, 255].
 
         '''
-        from pyglet import gl
         self._layout = layout
         if batch is None:
             batch = layout.batch
         r, g, b = color
-        colors = (r, g, b, 255, r, g, b, 255)
+        # Copy of the vertex colors, written to the vertex list in one go.
+        self._colors = [r, g, b, 255, r, g, b, 255]
         self._list = batch.add(2, gl.GL_LINES, layout.background_group, 
-            'v2f', ('c4B', colors))
+            'v2f', ('c4B', self._colors))
 
         self._ideal_x = None
         self._ideal_line = None
         self._next_attributes = {}
+        self._position = 0
+        self._mark = None
 
+        self._active = True
+        self._blink_visible = True
+        self._blink_scheduled = False
+        self._blink_hold = False
+        self._click_count = 0
+        self._click_time = 0
         self.visible = True
 
         layout.push_handlers(self)
@@ -144,25 +181,46 @@ class Caret(object):
         self._layout.remove_handlers(self)
 
     def _blink(self, dt):
-        if self.PERIOD:
+        if self._blink_hold:
+            # Nudged since the last blink; stay shown for this one.
+            self._blink_hold = False
+        elif self.PERIOD:
             self._blink_visible = not self._blink_visible
+        self._apply_blink()
+
+    def _apply_blink(self):
         if self._visible and self._active and self._blink_visible:
             alpha = 255
         else:
             alpha = 0
-        self._list.colors[3] = alpha
-        self._list.colors[7] = alpha
+        colors = self._colors
+        colors[3] = colors[7] = alpha
+        self._list.colors[:] = colors
 
     def _nudge(self):
+        # Show the caret and keep it shown through the next blink, so it
+        # stays solid while the user types.
+        self._blink_hold = True
         self.visible = True
 
     def _set_visible(self, visible):
         self._visible = visible
-        clock.unschedule(self._blink)
-        if visible and self._active and self.PERIOD:
-            clock.schedule_interval(self._blink, self.PERIOD)
-            self._blink_visible = False # flipped immediately by next blink
-        self._blink(0)
+        self._reapply_blink_state()
+
+    def _reapply_blink_state(self):
+        # Only touch the clock when blinking starts or stops; unschedule
+        # searches the whole schedule.
+        blink = bool(self._visible and self._active and self.PERIOD)
+        if blink != self._blink_scheduled:
+            if blink:
+                clock.schedule_interval(self._blink, self.PERIOD)
+                # A new interval already waits a full period.
+                self._blink_hold = False
+            else:
+                clock.unschedule(self._blink)
+            self._blink_scheduled = blink
+        self._blink_visible = True
+        self._apply_blink()
 
     def _get_visible(self):
         return self._visible
@@ -177,11 +235,15 @@ class Caret(object):
     ''')
     
     def _set_color(self, color):
-        self._list.colors[:3] = color
-        self._list.colors[4:7] = color
+        r, g, b = color
+        colors = self._colors
+        colors[0] = colors[4] = r
+        colors[1] = colors[5] = g
+        colors[2] = colors[6] = b
+        self._list.colors[:] = colors
 
     def _get_color(self):
-        return self._list.colors[:3]
+        return self._colors[:3]
 
     color = property(_get_color, _set_color, 
                      doc='''Caret color.
@@ -197,6 +259,12 @@ class Caret(object):
         self._next_attributes.clear()
         self._update()
 
+    def _set_position_no_update(self, index):
+        # As `position`, but leaves the caret update to the caller, which
+        # usually knows the line already.
+        self._position = index
+        self._next_attributes.clear()
+
     def _get_position(self):
         return self._position
 
@@ -206,7 +274,6 @@ class Caret(object):
     :type: int
     ''')
 
-    _mark = None
     def _set_mark(self, mark):
         self._mark = mark
         self._update(line=self._ideal_line)
@@ -353,22 +420,12 @@ class Caret(object):
                 Y coordinate.
 
         '''
-        line = self._layout.get_line_from_point(x, y)
-        p = self._layout.get_position_on_line(line, x)
-        m1 = self._previous_word_re.search(self._layout.document.text, 
-                                           0, p+1)
-        if not m1:
-            m1 = 0
-        else:
-            m1 = m1.start()
-        self.mark = m1
-
-        m2 = self._next_word_re.search(self._layout.document.text, p)
-        if not m2:
-            m2 = len(self._layout.document.text)
-        else:
-            m2 = m2.start()
-        self._position = m2
+        layout = self._layout
+        line = layout.get_line_from_point(x, y)
+        p = layout.get_position_on_line(line, x)
+        text = layout.document.text
+        self._mark = _get_previous_word_start(text, p + 1)
+        self._position = _get_next_word_start(text, p)
         self._update(line=line)
         self._next_attributes.clear()
 
@@ -382,10 +439,12 @@ class Caret(object):
                 Y coordinate.
 
         '''
-        line = self._layout.get_line_from_point(x, y)
-        p = self._layout.get_position_on_line(line, x)
-        self.mark = self._layout.document.get_paragraph_start(p)
-        self._position = self._layout.document.get_paragraph_end(p)
+        layout = self._layout
+        document = layout.document
+        line = layout.get_line_from_point(x, y)
+        p = layout.get_position_on_line(line, x)
+        self._mark = document.get_paragraph_start(p)
+        self._position = document.get_paragraph_end(p)
         self._update(line=line) 
         self._next_attributes.clear()
 
@@ -402,18 +461,18 @@ class Caret(object):
         x -= self._layout.top_group.translate_x
         y -= self._layout.top_group.translate_y
         font = self._layout.document.get_font(max(0, self._position - 1))
-        self._list.vertices[:] = [x, y + font.descent, x, y + font.ascent]
+        self._list.vertices[:] = (x, y + font.descent, x, y + font.ascent)
 
         if self._mark is not None:
             self._layout.set_selection(min(self._position, self._mark),
                                           max(self._position, self._mark))
 
-        self._layout.ensure_line_visible(line)
-        self._layout.ensure_x_visible(x)
+        self._layout.ensure_visible(line, x)
 
     def on_layout_update(self):
-        if self.position > len(self._layout.document.text):
-            self.position = len(self._layout.document.text)
+        length = self._layout.document.length
+        if self._position > length:
+            self._set_position_no_update(length)
         self._update()
 
     def on_text(self, text):
@@ -433,6 +492,60 @@ class Caret(object):
         self._nudge()
         return event.EVENT_HANDLED
 
+    def _motion_left(self, layout, text):
+        self.position = max(0, self._position - 1)
+
+    def _motion_right(self, layout, text):
+        self.position = min(len(text), self._position + 1)
+
+    def _motion_up(self, layout, text):
+        self.line = max(0, self.line - 1)
+
+    def _motion_down(self, layout, text):
+        line = self.line
+        if line < layout.get_line_count() - 1:
+            self.line = line + 1
+
+    def _motion_beginning_of_line(self, layout, text):
+        line = self.line
+        self._set_position_no_update(layout.get_position_from_line(line))
+        self._update(line)
+
+    def _motion_end_of_line(self, layout, text):
+        line = self.line
+        if line < layout.get_line_count() - 1:
+            self._position = layout.get_position_from_line(line + 1) - 1
+        else:
+            self._set_position_no_update(len(text))
+        self._update(line)
+
+    def _motion_beginning_of_file(self, layout, text):
+        self.position = 0
+
+    def _motion_end_of_file(self, layout, text):
+        self.position = len(text)
+
+    def _motion_next_word(self, layout, text):
+        self.position = _get_next_word_start(text, self._position + 1)
+
+    def _motion_previous_word(self, layout, text):
+        self.position = _get_previous_word_start(text, self._position)
+
+    # Caret movement for each motion, called after any deletion and mark
+    # clearing in `on_text_motion`.
+    _motion_handlers = {
+        key.MOTION_LEFT: _motion_left,
+        key.MOTION_RIGHT: _motion_right,
+        key.MOTION_UP: _motion_up,
+        key.MOTION_DOWN: _motion_down,
+        key.MOTION_BEGINNING_OF_LINE: _motion_beginning_of_line,
+        key.MOTION_END_OF_LINE: _motion_end_of_line,
+        key.MOTION_BEGINNING_OF_FILE: _motion_beginning_of_file,
+        key.MOTION_END_OF_FILE: _motion_end_of_file,
+        key.MOTION_NEXT_WORD: _motion_next_word,
+        key.MOTION_PREVIOUS_WORD: _motion_previous_word,
+    }
+
     def on_text_motion(self, motion, select=False):
         '''Handler for the `pyglet.window.Window.on_text_motion` event.
 
@@ -440,63 +553,26 @@ class Caret(object):
         GUI toolkits should filter keyboard and text events by widget focus
         before invoking this handler.
         '''
+        layout = self._layout
+        document = layout.document
         if motion == key.MOTION_BACKSPACE:
-            if self.mark is not None:
+            if self._mark is not None:
                 self._delete_selection()
             elif self._position > 0:
                 self._position -= 1
-                self._layout.document.delete_text(
-                    self._position, self._position + 1)
+                document.delete_text(self._position, self._position + 1)
         elif motion == key.MOTION_DELETE:
-            if self.mark is not None:
+            if self._mark is not None:
                 self._delete_selection()
-            elif self._position < len(self._layout.document.text):
-                self._layout.document.delete_text(
-                    self._position, self._position + 1)
+            elif self._position < document.length:
+                document.delete_text(self._position, self._position + 1)
         elif self._mark is not None and not select:
             self._mark = None
-            self._layout.set_selection(0, 0)
+            layout.set_selection(0, 0)
 
-        if motion == key.MOTION_LEFT:
-            self.position = max(0, self.position - 1)
-        elif motion == key.MOTION_RIGHT:
-            self.position = min(len(self._layout.document.text), 
-                                self.position + 1) 
-        elif motion == key.MOTION_UP:
-            self.line = max(0, self.line - 1)
-        elif motion == key.MOTION_DOWN:
-            line = self.line
-            if line < self._layout.get_line_count() - 1:
-                self.line = line + 1
-        elif motion == key.MOTION_BEGINNING_OF_LINE:
-            self.position = self._layout.get_position_from_line(self.line)
-        elif motion == key.MOTION_END_OF_LINE:
-            line = self.line
-            if line < self._layout.get_line_count() - 1:
-                self._position = \
-                    self._layout.get_position_from_line(line + 1) - 1
-                self._update(line)
-            else:
-                self.position = len(self._layout.document.text)
-        elif motion == key.MOTION_BEGINNING_OF_FILE:
-            self.position = 0
-        elif motion == key.MOTION_END_OF_FILE:
-            self.position = len(self._layout.document.text)
-        elif motion == key.MOTION_NEXT_WORD:
-            pos = self._position + 1
-            m = self._next_word_re.search(self._layout.document.text, pos)
-            if not m:
-                self.position = len(self._layout.document.text)
-            else:
-                self.position = m.start()
-        elif motion == key.MOTION_PREVIOUS_WORD:
-            pos = self._position
-            m = self._previous_word_re.search(self._layout.document.text, 
-                                              0, pos)
-            if not m:
-                self.position = 0
-            else:
-                self.position = m.start()
+        handler = self._motion_handlers.get(motion)
+        if handler is not None:
+            handler(self, layout, document.text)
 
         self._next_attributes.clear()
         self._nudge()
@@ -542,12 +618,12 @@ class Caret(object):
         widget must also be tracked.  Do not use this mouse handler if
         a GUI toolkit is being used.
         '''
-        t = time.time()
+        t = _monotonic()
         if t - self._click_time < 0.25:
             self._click_count += 1
         else:
             self._click_count = 1
-        self._click_time = time.time()
+        self._click_time = t
 
         if self._click_count == 1:
             self.move_to_point(x, y)
@@ -567,8 +643,8 @@ class Caret(object):
         toolkits should filter events that do not intersect the layout
         before invoking this handler.
         '''
-        if self.mark is None:
-            self.mark = self.position
+        if self._mark is None:
+            self._mark = self._position
         self.select_to_point(x, y)
         self._nudge()
         return event.EVENT_HANDLED
@@ -579,7 +655,7 @@ class Caret(object):
         The caret is hidden when the window is not active.
         '''
         self._active = True
-        self.visible = self._active
+        self._reapply_blink_state()
         return event.EVENT_HANDLED
 
     def on_deactivate(self):
@@ -588,5 +664,5 @@ class Caret(object):
         The caret is hidden when the window is not active.
         '''
         self._active = False
-        self.visible = self._active
+        self._reapply_blink_state()
         return event.EVENT_HANDLED
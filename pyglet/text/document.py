@@ -298,6 +298,17 @@ class AbstractDocument(event.EventDispatcher):
         self.delete_text(0, len(self._text))
         self.insert_text(0, text)
 
+    @property
+    def length(self):
+        """Number of characters in the document.
+
+        Equivalent to ``len(document.text)``, without going through the
+        `text` property.
+
+        :type: int
+        """
+        return len(self._text)
+
     def get_paragraph_start(self, pos):
         """Get the starting position of a paragraph.
 
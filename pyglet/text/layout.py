@@ -2452,6 +2452,23 @@ class IncrementalTextLayout(ScrollableTextLayout, event.EventDispatcher):
                       self.content_width > self.width):
             self.view_x = x - self.width + 10
 
+    def ensure_visible(self, line, x):
+        """Adjust `view_y` and `view_x` so that the line with the given index
+        and the given X coordinate are both visible.
+
+        This is equivalent to calling `ensure_line_visible` followed by
+        `ensure_x_visible`.
+
+        :Parameters:
+            `line` : int
+                Line index.
+            `x` : int
+                X coordinate, relative to the current `view_x`.
+
+        """
+        self.ensure_line_visible(line)
+        self.ensure_x_visible(x)
+
     if _is_epydoc:
         def on_layout_update(self):
             """Some or all of the layout text was reflowed.
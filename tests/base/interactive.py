@@ -1,8 +1,9 @@
 from __future__ import absolute_import, print_function
-from builtins import zip
+from builtins import map
 from builtins import input
 
 import array
+import operator
 import os
 import pytest
 import shutil
@@ -136,18 +137,23 @@ class InteractiveFixture(object):
         assert a_data.height == b_data.height, msg
         assert a_data.format == b_data.format, msg
         assert a_data.pitch == b_data.pitch, msg
-        self.assert_buffer_equal(a_data.data, b_data.data, tolerance, msg)
+        if tolerance == 0:
+            # Exact match is a single memcmp of the two buffers
+            assert a_data.data == b_data.data, msg
+        else:
+            self.assert_buffer_equal(a_data.data, b_data.data, tolerance, msg)
 
     def assert_buffer_equal(self, a, b, tolerance=0, msg=None):
         if tolerance == 0:
             assert a == b, msg
+            return
 
         assert len(a) == len(b), msg
 
         a = array.array('B', a)
         b = array.array('B', b)
-        for (aa, bb) in zip(a, b):
-            assert abs(aa - bb) <= tolerance, msg
+        # Largest difference between any two bytes, without a Python loop
+        assert not a or max(map(abs, map(operator.sub, a, b))) <= tolerance, msg
 
     def commit_screenshots(self):
         """
@@ -228,18 +234,23 @@ class InteractiveTestCase(PygletTestCase):
         self.assertEqual(a_data.height, b_data.height, msg)
         self.assertEqual(a_data.format, b_data.format, msg)
         self.assertEqual(a_data.pitch, b_data.pitch, msg)
-        self.assert_buffer_equal(a_data.data, b_data.data, tolerance, msg)
+        if tolerance == 0:
+            # Exact match is a single memcmp of the two buffers
+            self.assertTrue(a_data.data == b_data.data, msg)
+        else:
+            self.assert_buffer_equal(a_data.data, b_data.data, tolerance, msg)
 
     def assert_buffer_equal(self, a, b, tolerance=0, msg=None):
         if tolerance == 0:
             self.assertEqual(a, b, msg)
+            return
 
         self.assertEqual(len(a), len(b), msg)
 
         a = array.array('B', a)
         b = array.array('B', b)
-        for (aa, bb) in zip(a, b):
-            self.assertTrue(abs(aa - bb) <= tolerance, msg)
+        # Largest difference between any two bytes, without a Python loop
+        self.assertTrue(not a or max(map(abs, map(operator.sub, a, b))) <= tolerance, msg)
 
     def _take_screenshot(self):
         """
@@ -250,23 +261,24 @@ class InteractiveTestCase(PygletTestCase):
 
         get_buffer_manager().get_color_buffer().image_data.save(screenshot_file_name)
 
-        self._screenshots.append(screenshot_name)
+        self._screenshots.append((screenshot_name,
+                                  screenshot_file_name,
+                                  self._get_screenshot_committed_file_name(screenshot_name)))
 
     def _commit_screenshots(self):
         """
         Store the screenshots for reference if the test case is successful.
         """
-        for screenshot_name in self._screenshots:
-            shutil.copyfile(self._get_screenshot_session_file_name(screenshot_name),
-                            self._get_screenshot_committed_file_name(screenshot_name))
+        for _, session_file_name, committed_file_name in self._screenshots:
+            shutil.copyfile(session_file_name, committed_file_name)
 
     def _validate_screenshots(self):
         """
         Check the screenshot against regression reference images if available.
         """
-        for screenshot_name in self._screenshots:
-            committed_image = pyglet.image.load(self._get_screenshot_committed_file_name(screenshot_name))
-            session_image = pyglet.image.load(self._get_screenshot_session_file_name(screenshot_name))
+        for _, session_file_name, committed_file_name in self._screenshots:
+            committed_image = pyglet.image.load(committed_file_name)
+            session_image = pyglet.image.load(session_file_name)
             self.assert_image_equal(committed_image, session_image)
 
     def _has_reference_screenshots(self):
@@ -275,8 +287,13 @@ class InteractiveTestCase(PygletTestCase):
         against. Use after taking all required screenshots. Also validates the number of required
         screenshots.
         """
-        for screenshot_name in self._screenshots:
-            if not os.path.isfile(self._get_screenshot_committed_file_name(screenshot_name)):
+        # List the directory once instead of a stat per screenshot
+        try:
+            committed = set(os.listdir(committed_screenshot_path))
+        except OSError:
+            committed = set()
+        for screenshot_name, _, _ in self._screenshots:
+            if screenshot_name not in committed:
                 return False
         else:
             return True
@@ -306,6 +323,9 @@ if _has_gui:
                 failure_description = 'No description entered'
         return failure_description
 else:
+    _yes_responses = frozenset('Yy')
+    _no_responses = frozenset('Nn')
+
     def _ask_user_to_verify(description):
         failure_description = None
         print()
@@ -314,12 +334,12 @@ else:
             response = input('Passed [Yn]: ')
             if not response:
                 break
-            elif response in 'Nn':
+            elif response[:1] in _no_responses:
                 failure_description = input('Enter failure description: ')
                 if not failure_description:
                     failure_description = 'No description entered'
                 break
-            elif response in 'Yy':
+            elif response[:1] in _yes_responses:
                 break
             else:
                 print('Invalid response')
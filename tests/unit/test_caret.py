@@ -0,0 +1,64 @@
+"""
+Test word boundaries used by pyglet.text.caret
+"""
+
+import random
+import re
+
+import pytest
+
+from pyglet.text.caret import _get_next_word_start, _get_previous_word_start
+
+
+@pytest.mark.parametrize('text, pos, expected', [
+    (u'', 0, 0),
+    (u'foo bar', 0, 4),             # the leading word is never the next word
+    (u'foo bar', 1, 4),
+    (u'foo bar', 4, 4),
+    (u'foo bar', 5, 7),             # no next word: end of text
+    (u'foo, ... bar', 3, 9),        # punctuation run
+    (u'a_b c', 0, 4),               # underscore is a word character
+    (u'a.b', 0, 2),
+    (u'h\u00e9llo w\u00f6rld', 1, 6),  # non-ASCII word characters
+    (u'\u00e9 \u00e9', 0, 2),
+    (u'foo', 10, 3),                # pos past the end
+])
+def test_next_word_start(text, pos, expected):
+    assert _get_next_word_start(text, pos) == expected
+
+
+@pytest.mark.parametrize('text, pos, expected', [
+    (u'', 0, 0),
+    (u'foo bar', 0, 0),
+    (u'foo bar', 4, 0),
+    (u'foo bar', 5, 4),
+    (u'foo bar', 7, 4),
+    (u'foo, ... bar', 9, 0),        # punctuation run
+    (u'foo, ... bar', 12, 9),
+    (u'a_b c', 4, 0),               # underscore is a word character
+    (u'a_b c', 5, 4),
+    (u'h\u00e9llo w\u00f6rld', 6, 0),  # non-ASCII word characters
+    (u'h\u00e9llo w\u00f6rld', 11, 6),
+    (u'foo bar', 20, 4),            # pos past the end
+])
+def test_previous_word_start(text, pos, expected):
+    assert _get_previous_word_start(text, pos) == expected
+
+
+# Patterns the caret used before the word boundary search was rewritten.
+_reference_next_word_re = re.compile(r'(?<=\W)\w', re.UNICODE)
+_reference_previous_word_re = re.compile(r'(?<=\W)\w+\W*$', re.UNICODE)
+
+
+def test_word_start_matches_reference():
+    rng = random.Random(0)
+    for _ in range(2000):
+        text = u''.join(rng.choice(u'ab_1 ,.\n\u00e9') for _ in range(rng.randint(0, 20)))
+        for pos in range(len(text) + 2):
+            m = _reference_next_word_re.search(text, pos)
+            expected = m.start() if m else len(text)
+            assert _get_next_word_start(text, pos) == expected, (text, pos)
+
+            m = _reference_previous_word_re.search(text, 0, pos)
+            expected = m.start() if m else 0
+            assert _get_previous_word_start(text, pos) == expected, (text, pos)
@@ -0,0 +1,93 @@
+"""
+Test line breaking in pyglet.font.text.GlyphString
+"""
+
+import random
+
+import pytest
+
+from pyglet.font.text import GlyphString, _find_break_indices
+
+
+def _glyph_string(text, advances):
+    """Make a GlyphString without glyphs or a GL context; only the data used by
+    get_break_index is filled in."""
+    glyph_string = GlyphString.__new__(GlyphString)
+    glyph_string.text = text
+    glyph_string.cumulative_advance = []
+    x = 0
+    for advance in advances:
+        x += advance
+        glyph_string.cumulative_advance.append(x)
+    glyph_string._newline_indices, glyph_string._space_indices = \
+        _find_break_indices(text, len(advances))
+    return glyph_string
+
+
+@pytest.mark.parametrize('text, glyph_count, newlines, spaces', [
+    (u'', 0, [], []),
+    (u'ab cd\nef', 8, [5], [2]),
+    (u'a \u200bb\n\n', 6, [4, 5], [1, 2]),
+    (u'ab cd\nef gh', 4, [], [2]),     # characters without glyphs are ignored
+    (u'ab', 5, [], []),                # more glyphs than characters
+])
+def test_find_break_indices(text, glyph_count, newlines, spaces):
+    assert _find_break_indices(text, glyph_count) == (newlines, spaces)
+
+
+def _reference_break_index(glyph_string, from_index, width):
+    """Linear scan that get_break_index used before it was rewritten with bisect."""
+    to_index = from_index
+    if from_index >= len(glyph_string.text):
+        return from_index
+    if from_index:
+        width += glyph_string.cumulative_advance[from_index-1]
+    for i, (c, w) in enumerate(zip(glyph_string.text[from_index:],
+                                   glyph_string.cumulative_advance[from_index:])):
+        if c in u' \u200b':
+            to_index = i + from_index + 1
+        if c == u'\n':
+            return i + from_index + 1
+        if w > width:
+            return to_index
+    return to_index
+
+
+@pytest.mark.parametrize('text, from_index, width, expected', [
+    (u'ab cd ef', 0, 45, 3),          # break at the space before the overflow
+    (u'ab\ncdef', 0, 100, 3),         # newline before overflow
+    (u'ab cd\nef', 0, 100, 6),        # newline wins over an earlier space
+    (u'abcd efg', 0, 45, 5),          # the overflowing character is a space
+    (u'ab\u200bcd', 0, 35, 3),        # zero width space is a breakpoint
+    (u'ab cd ef gh', 3, 45, 6),       # width is measured from from_index
+    (u'ab cd\nef gh', 3, 100, 6),     # newline after from_index
+    (u'ab cd ef', 6, 10, 6),          # no breakpoint after from_index
+    (u'abcdef', 0, 25, 0),            # no breakpoint at all
+    (u'ab cd', 0, 100, 3),            # fits, breaks at the last space
+    (u'ab cd', 5, 100, 5),            # from_index at the end of the text
+])
+def test_get_break_index(text, from_index, width, expected):
+    glyph_string = _glyph_string(text, [10] * len(text))
+    assert glyph_string.get_break_index(from_index, width) == expected
+
+
+def test_get_break_index_text_longer_than_glyphs():
+    # Only the first four characters have glyphs; later breakpoints are ignored.
+    glyph_string = _glyph_string(u'ab cd ef', [10] * 4)
+    assert glyph_string.get_break_index(0, 100) == 3
+    assert glyph_string.get_break_index(0, 25) == 3
+    assert glyph_string.get_break_index(4, 100) == 4
+
+
+def test_get_break_index_matches_reference():
+    rng = random.Random(0)
+    for _ in range(2000):
+        text = u''.join(rng.choice(u'ab \n\u200b') for _ in range(rng.randint(0, 20)))
+        advances = [rng.randint(0, 12) for _ in range(len(text) - rng.randint(0, 3))]
+        glyph_string = _glyph_string(text, advances)
+        for _ in range(5):
+            from_index = rng.randint(0, len(advances))
+            width = rng.randint(0, 100)
+            assert (glyph_string.get_break_index(from_index, width) ==
+                    _reference_break_index(glyph_string, from_index, width)), \
+                (text, advances, from_index, width)
@@ -299,6 +299,30 @@ class TestStyleRuns(unittest.TestCase):
         self.check_value(runs, 'aaaabbccc')
 
 
+class TestDocumentLength(unittest.TestCase):
+
+    def check_length(self, doc):
+        self.assertEqual(doc.length, len(doc.text))
+        doc.insert_text(0, 'abc')
+        self.assertEqual(doc.length, len(doc.text))
+        doc.insert_text(doc.length, '\nd\u00e9f')
+        self.assertEqual(doc.length, len(doc.text))
+        doc.delete_text(1, 3)
+        self.assertEqual(doc.length, len(doc.text))
+        doc.text = ''
+        self.assertEqual(doc.length, 0)
+
+    def test_unformatted(self):
+        doc = pyglet.text.document.UnformattedDocument()
+        self.assertEqual(doc.length, 0)
+        self.check_length(doc)
+
+    def test_formatted(self):
+        doc = pyglet.text.document.FormattedDocument('hello')
+        self.assertEqual(doc.length, 5)
+        self.check_length(doc)
+
+
 class TestIssues(unittest.TestCase):
 
     def test_issue471(self):